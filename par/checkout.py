@@ -5,6 +5,11 @@ from dataclasses import dataclass
 from typing import Tuple
 from urllib.parse import urlparse
 
+# Patterns used to turn branch names into session labels
+_SEPARATOR_RE = re.compile(r"[/_]")
+_INVALID_LABEL_CHARS_RE = re.compile(r"[^a-z0-9-]")
+_HYPHEN_RUN_RE = re.compile(r"-+")
+
 
 @dataclass
 class CheckoutStrategy:
@@ -86,11 +91,11 @@ def generate_label_from_branch(branch_name: str) -> str:
     """Generate session label from branch name."""
     # Clean up branch name for use as label
     # Replace slashes and underscores with hyphens, convert to lowercase
-    label = re.sub(r"[/_]", "-", branch_name.lower())
+    label = _SEPARATOR_RE.sub("-", branch_name.lower())
     # Remove any other special characters except hyphens and alphanumeric
-    label = re.sub(r"[^a-z0-9-]", "", label)
+    label = _INVALID_LABEL_CHARS_RE.sub("", label)
     # Remove leading/trailing hyphens and collapse multiple hyphens
-    label = re.sub(r"-+", "-", label).strip("-")
+    label = _HYPHEN_RUN_RE.sub("-", label).strip("-")
 
     # Ensure we have a valid label
     if not label:
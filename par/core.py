@@ -2,25 +2,42 @@
 
 import datetime
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
-
-from . import checkout, initialization, operations, utils, workspace
 
+from . import checkout, initialization, operations, utils
 
 # Global state management
+# Parsed global state, keyed on the state file's path, inode, mtime and size so
+# repeated loads within one process skip re-reading and re-parsing an unchanged file.
+# Callers that mutate the returned state are expected to save it. "content" is
+# the file text the cached state was read from or written as, letting saves
+# that would not change anything skip the write.
+_STATE_CACHE: Dict[str, Any] = {"key": None, "state": None, "content": None}
+
+
 def _get_global_state_file() -> Path:
     return utils.get_data_dir() / "global_state.json"
 
 
+def _state_cache_key(state_file: Path, stat: os.stat_result) -> tuple:
+    # The inode changes on every atomic save, so a file replaced within the
+    # filesystem's mtime granularity at the same size still misses the cache.
+    return (str(state_file), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
 def _load_global_state() -> Dict[str, Any]:
     state_file = _get_global_state_file()
-    if not state_file.exists():
+    # One stat both detects a missing state file and keys the cache
+    try:
+        stat = state_file.stat()
+    except FileNotFoundError:
         # Try to migrate from old state files
         migrated_state = _migrate_legacy_state()
         if migrated_state:
@@ -28,26 +45,89 @@ def _load_global_state() -> Dict[str, Any]:
             return migrated_state
         return {"sessions": {}, "workspaces": {}}
 
+    cache_key = _state_cache_key(state_file, stat)
+    if _STATE_CACHE["key"] == cache_key:
+        return _STATE_CACHE["state"]
+
     try:
         with open(state_file, "r") as f:
-            content = f.read().strip()
-            state = json.loads(content) if content else {}
-            # Ensure structure exists
-            if "sessions" not in state:
-                state["sessions"] = {}
-            if "workspaces" not in state:
-                state["workspaces"] = {}
-            return state
+            content = f.read()
+        # An empty or whitespace-only file means no state yet
+        state = json.loads(content) if content.strip() else {}
+        # Ensure structure exists
+        if "sessions" not in state:
+            state["sessions"] = {}
+        if "workspaces" not in state:
+            state["workspaces"] = {}
+        _STATE_CACHE["key"] = cache_key
+        _STATE_CACHE["state"] = state
+        _STATE_CACHE["content"] = content
+        return state
     except json.JSONDecodeError:
         typer.secho("Warning: Global state file corrupted. Starting fresh.", fg="yellow")
         return {"sessions": {}, "workspaces": {}}
 
 
+def _fsync_directory(directory: Path):
+    """Flush a directory entry update (such as a rename) to disk where supported."""
+    if not hasattr(os, "O_DIRECTORY"):
+        # Windows cannot open directories for fsync
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def _save_global_state(state: Dict[str, Any]):
     state_file = _get_global_state_file()
+    # Serialize up front and write once; json.dump with indent issues a
+    # separate write() call per token.
+    content = json.dumps(state, indent=2)
+
+    # Skip the write entirely when the file already holds exactly this content
+    try:
+        stat = state_file.stat()
+        current_key = _state_cache_key(state_file, stat)
+    except FileNotFoundError:
+        current_key = None
+    if (
+        current_key
+        and _STATE_CACHE["key"] == current_key
+        and _STATE_CACHE["content"] == content
+    ):
+        _STATE_CACHE["state"] = state
+        return
+
     state_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(state_file, "w") as f:
-        json.dump(state, f, indent=2)
+    # Write to a temporary file and rename it into place so concurrent par
+    # processes never read a half-written state file.
+    temp_file = state_file.with_name(f"{state_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file, "w") as f:
+            f.write(content)
+            # Make the data durable before the rename publishes it
+            f.flush()
+            os.fsync(f.fileno())
+        # The rename keeps inode, mtime and size, so the temp file's stat is the
+        # saved file's cache key, without racing another writer's rename.
+        stat = temp_file.stat()
+        temp_file.replace(state_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    _fsync_directory(state_file.parent)
+
+    # Write through so the next load in this process skips re-reading the file
+    _STATE_CACHE["key"] = _state_cache_key(state_file, stat)
+    _STATE_CACHE["state"] = state
+    _STATE_CACHE["content"] = content
 
 
 def _update_last_session(label: str):
@@ -55,7 +135,10 @@ def _update_last_session(label: str):
     state = _load_global_state()
     # Store the current last_session as previous_session before updating
     current_last = state.get("last_session")
-    if current_last and current_last != label:
+    if current_last == label:
+        # Nothing changes; skip rewriting the whole state file
+        return
+    if current_last:
         state["previous_session"] = current_last
     state["last_session"] = label
     _save_global_state(state)
@@ -99,6 +182,13 @@ def _resolve_previous_session_label() -> str:
     return previous_session
 
 
+def _read_json_file(path: Path) -> Dict[str, Any]:
+    """Parse a JSON file, treating an empty or whitespace-only file as an empty dict."""
+    with open(path, "r") as f:
+        content = f.read()
+    return json.loads(content) if content.strip() else {}
+
+
 def _migrate_legacy_state() -> Dict[str, Any]:
     """Migrate from old per-repo state files to global state."""
     legacy_state_file = utils.get_data_dir() / "state.json"
@@ -107,65 +197,60 @@ def _migrate_legacy_state() -> Dict[str, Any]:
     migrated = {"sessions": {}, "workspaces": {}}
 
     # Migrate legacy sessions
-    if legacy_state_file.exists():
-        try:
-            with open(legacy_state_file, "r") as f:
-                content = f.read().strip()
-                legacy_state = json.loads(content) if content else {}
-
-            for repo_path, repo_sessions in legacy_state.items():
-                repo_path_obj = Path(repo_path)
-                repo_name = repo_path_obj.name
-
-                for label, session_data in repo_sessions.items():
-                    # Create globally unique label if collision
-                    global_label = label
-                    counter = 1
-                    while global_label in migrated["sessions"]:
-                        global_label = f"{label}-{repo_name.lower()}-{counter}"
-                        counter += 1
-
-                    migrated["sessions"][global_label] = {
-                        "label": global_label,
-                        "repository_path": repo_path,
-                        "repository_name": repo_name,
-                        "worktree_path": session_data["worktree_path"],
-                        "tmux_session_name": session_data["tmux_session_name"],
-                        "branch_name": session_data["branch_name"],
-                        "created_at": session_data["created_at"],
-                        "session_type": "checkout" if session_data.get("is_checkout") else "session",
-                        "checkout_target": session_data.get("checkout_target")
-                    }
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
+    try:
+        legacy_state = _read_json_file(legacy_state_file)
+
+        for repo_path, repo_sessions in legacy_state.items():
+            repo_path_obj = Path(repo_path)
+            repo_name = repo_path_obj.name
+
+            for label, session_data in repo_sessions.items():
+                # Create globally unique label if collision
+                global_label = label
+                counter = 1
+                while global_label in migrated["sessions"]:
+                    global_label = f"{label}-{repo_name.lower()}-{counter}"
+                    counter += 1
+
+                migrated["sessions"][global_label] = {
+                    "label": global_label,
+                    "repository_path": repo_path,
+                    "repository_name": repo_name,
+                    "worktree_path": session_data["worktree_path"],
+                    "tmux_session_name": session_data["tmux_session_name"],
+                    "branch_name": session_data["branch_name"],
+                    "created_at": session_data["created_at"],
+                    "session_type": "checkout" if session_data.get("is_checkout") else "session",
+                    "checkout_target": session_data.get("checkout_target")
+                }
+    except (json.JSONDecodeError, FileNotFoundError):
+        # Missing legacy files are the common case; nothing to migrate
+        pass
 
     # Migrate legacy workspaces
-    if legacy_workspace_file.exists():
-        try:
-            with open(legacy_workspace_file, "r") as f:
-                content = f.read().strip()
-                legacy_workspaces = json.loads(content) if content else {}
-
-            for workspace_root, workspace_sessions in legacy_workspaces.items():
-                for label, workspace_data in workspace_sessions.items():
-                    # Create globally unique label if collision
-                    global_label = label
-                    counter = 1
-                    while (global_label in migrated["sessions"] or
-                           global_label in migrated["workspaces"]):
-                        workspace_name = Path(workspace_root).name
-                        global_label = f"{label}-{workspace_name.lower()}-{counter}"
-                        counter += 1
-
-                    migrated["workspaces"][global_label] = {
-                        "label": global_label,
-                        "workspace_root": workspace_data["workspace_root"],
-                        "session_name": workspace_data["session_name"],
-                        "repos": workspace_data["repos"],
-                        "created_at": workspace_data["created_at"]
-                    }
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
+    try:
+        legacy_workspaces = _read_json_file(legacy_workspace_file)
+
+        for workspace_root, workspace_sessions in legacy_workspaces.items():
+            for label, workspace_data in workspace_sessions.items():
+                # Create globally unique label if collision
+                global_label = label
+                counter = 1
+                while (global_label in migrated["sessions"] or
+                       global_label in migrated["workspaces"]):
+                    workspace_name = Path(workspace_root).name
+                    global_label = f"{label}-{workspace_name.lower()}-{counter}"
+                    counter += 1
+
+                migrated["workspaces"][global_label] = {
+                    "label": global_label,
+                    "workspace_root": workspace_data["workspace_root"],
+                    "session_name": workspace_data["session_name"],
+                    "repos": workspace_data["repos"],
+                    "created_at": workspace_data["created_at"]
+                }
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
 
     # If we migrated anything, backup the old files
     if migrated["sessions"] or migrated["workspaces"]:
@@ -195,23 +280,34 @@ def _get_all_sessions() -> Dict[str, Any]:
 
 
 # Workspaces are now stored as sessions with session_type="workspace"
+def _get_workspace_sessions() -> Dict[str, Any]:
+    """Get all workspace sessions globally."""
+    return {
+        label: data
+        for label, data in _get_all_sessions().items()
+        if data.get("session_type") == "workspace"
+    }
 
 
-def _add_session(session_data: Dict[str, Any]):
-    """Add a session to global state."""
-    state = _load_global_state()
-    state["sessions"][session_data["label"]] = session_data
-    _save_global_state(state)
-
+@contextmanager
+def _state_transaction() -> Iterator[Dict[str, Any]]:
+    """Load global state once, let the caller mutate it, and save it once.
 
-def _remove_session(label: str):
-    """Remove a session from global state."""
+    State is saved even if the block raises, so partial progress is kept.
+    """
     state = _load_global_state()
-    if label in state["sessions"]:
-        del state["sessions"][label]
+    try:
+        yield state
+    finally:
         _save_global_state(state)
 
 
+def _add_session(session_data: Dict[str, Any]):
+    """Add a session to global state."""
+    with _state_transaction() as state:
+        state["sessions"][session_data["label"]] = session_data
+
+
 def _get_session(label: str) -> Optional[Dict[str, Any]]:
     """Get a specific session by label."""
     state = _load_global_state()
@@ -312,9 +408,10 @@ def start_session(
 
     if open_session:
         typer.echo("Opening session...")
-        operations.open_tmux_session(session_name)
-        # Track this session as the last opened
+        # Track this session as the last opened. This must happen before
+        # attaching: outside tmux, attaching replaces the par process.
         _update_last_session(label)
+        operations.open_tmux_session(session_name)
     else:
         typer.echo(f"To open: par open {label}")
 
@@ -327,16 +424,29 @@ def remove_session(label: str):
         typer.secho(f"Error: Session '{label}' not found.", fg="red", err=True)
         raise typer.Exit(1)
 
-    session_type = session_data.get("session_type", "session")
+    with _state_transaction() as state:
+        _remove_session_inplace(state["sessions"], label)
+
 
+def _remove_session_resources(session_data: Dict[str, Any]):
+    """Clean up the tmux session, worktrees and branches backing a session."""
     # Handle workspace sessions differently
-    if session_type == "workspace":
+    if session_data.get("session_type", "session") == "workspace":
         _remove_workspace_session(session_data)
     else:
         _remove_regular_session(session_data)
 
-    # Remove from global state
-    _remove_session(label)
+
+def _remove_session_inplace(sessions: Dict[str, Any], label: str):
+    """Clean up a session's resources and drop it from an in-memory sessions dict.
+
+    Unlike remove_session, this does not persist state; callers batching several
+    removals are expected to save once when they are done.
+    """
+    session_data = sessions[label]
+    session_type = session_data.get("session_type", "session")
+    _remove_session_resources(session_data)
+    del sessions[label]
 
     typer.secho(
         f"Successfully removed {session_type} '{label}'.", fg="bright_green", bold=True
@@ -348,7 +458,8 @@ def _remove_regular_session(session_data: Dict[str, Any]):
     # Clean up resources
     operations.kill_tmux_session(session_data["tmux_session_name"])
     repo_root = Path(session_data["repository_path"])
-    operations.remove_worktree(Path(session_data["worktree_path"]), repo_root)
+    worktree_path = Path(session_data["worktree_path"])
+    worktree_removed = operations.remove_worktree(worktree_path, repo_root)
 
     # Delete only branches managed by par.
     if session_data.get(
@@ -356,9 +467,12 @@ def _remove_regular_session(session_data: Dict[str, Any]):
     ):
         operations.delete_branch(session_data["branch_name"], repo_root)
 
-    # Remove physical directory if it exists and is managed by par
-    worktree_path = Path(session_data["worktree_path"])
-    if worktree_path.exists() and utils.get_data_dir() in worktree_path.parents:
+    # Remove physical directory if git left it behind and it is managed by par
+    if (
+        not worktree_removed
+        and utils.is_managed_path(worktree_path)
+        and worktree_path.exists()
+    ):
         try:
             shutil.rmtree(worktree_path)
         except OSError as e:
@@ -367,24 +481,32 @@ def _remove_regular_session(session_data: Dict[str, Any]):
             )
 
 
+def _remove_workspace_repo(repo_data: Dict[str, Any]):
+    """Remove one workspace repo's worktree and branch."""
+    repo_path = Path(repo_data["repo_path"])
+    operations.remove_worktree(Path(repo_data["worktree_path"]), repo_path)
+    operations.delete_branch(repo_data["branch_name"], repo_path)
+
+
 def _remove_workspace_session(session_data: Dict[str, Any]):
     """Remove a workspace session and all its repositories."""
     # Kill tmux session
     operations.kill_tmux_session(session_data["tmux_session_name"])
 
-    # Remove worktrees and branches for each repo in the workspace
+    # Remove worktrees and branches for each repo in the workspace. Repos are
+    # independent, so clean them up concurrently.
     repos_data = session_data.get("workspace_repos", [])
-    for repo_data in repos_data:
-        repo_path = Path(repo_data["repo_path"])
-        worktree_path = Path(repo_data["worktree_path"])
-        branch_name = repo_data["branch_name"]
-
-        operations.remove_worktree(worktree_path, repo_path)
-        operations.delete_branch(branch_name, repo_path)
+    if repos_data:
+        with ThreadPoolExecutor(max_workers=min(16, len(repos_data))) as executor:
+            futures = [
+                executor.submit(_remove_workspace_repo, repo_data) for repo_data in repos_data
+            ]
+            for future in futures:
+                future.result()
 
     # Remove workspace directory if it exists and is managed by par
     workspace_root = Path(session_data["repository_path"])
-    if workspace_root.exists() and utils.get_data_dir() in workspace_root.parents:
+    if workspace_root.exists() and utils.is_managed_path(workspace_root):
         try:
             shutil.rmtree(workspace_root)
         except OSError as e:
@@ -393,12 +515,6 @@ def _remove_workspace_session(session_data: Dict[str, Any]):
             )
 
 
-def _get_workspace(label: str) -> Optional[Dict[str, Any]]:
-    """Get a specific workspace by label."""
-    state = _load_global_state()
-    return state["workspaces"].get(label)
-
-
 def remove_all_sessions():
     """Remove all sessions (including workspaces) globally."""
     sessions = _get_all_sessions()
@@ -408,8 +524,8 @@ def remove_all_sessions():
         return
 
     # Separate regular sessions from workspaces for display
-    regular_sessions = {k: v for k, v in sessions.items() if v.get("session_type") != "workspace"}
-    workspace_sessions = {k: v for k, v in sessions.items() if v.get("session_type") == "workspace"}
+    workspace_sessions = _get_workspace_sessions()
+    regular_sessions = [k for k in sessions if k not in workspace_sessions]
 
     typer.echo(f"This will remove {len(regular_sessions)} sessions and {len(workspace_sessions)} workspaces:")
     for label in regular_sessions:
@@ -419,11 +535,13 @@ def remove_all_sessions():
 
     typer.confirm(f"Remove all {len(sessions)} items?", abort=True)
 
-    # Remove all sessions (including workspaces)
-    for label in list(sessions.keys()):
-        session_type = sessions[label].get("session_type", "session")
-        typer.echo(f"Removing {session_type} '{label}'...")
-        remove_session(label)
+    # Remove all sessions (including workspaces), persisting state once
+    with _state_transaction() as state:
+        sessions = state["sessions"]
+        for label in list(sessions.keys()):
+            session_type = sessions[label].get("session_type", "session")
+            typer.echo(f"Removing {session_type} '{label}'...")
+            _remove_session_inplace(sessions, label)
 
     typer.secho("All sessions removed.", fg="bright_green", bold=True)
 
@@ -437,12 +555,19 @@ def send_command(target: str, command: str):
             typer.secho("No active sessions.", fg="yellow")
             return
 
-        # Send to all sessions (including workspaces)
-        for label, session_data in sessions.items():
-            session_name = session_data["tmux_session_name"]
-            session_type = session_data.get("session_type", "session")
-            typer.echo(f"Sending to {session_type} '{label}'...")
-            operations.send_tmux_keys(session_name, command)
+        # Send to all sessions (including workspaces). Each send is an
+        # independent tmux invocation, so dispatch them concurrently.
+        with ThreadPoolExecutor(max_workers=min(16, len(sessions))) as executor:
+            futures = []
+            for label, session_data in sessions.items():
+                session_name = session_data["tmux_session_name"]
+                session_type = session_data.get("session_type", "session")
+                typer.echo(f"Sending to {session_type} '{label}'...")
+                futures.append(
+                    executor.submit(operations.send_tmux_keys, session_name, command)
+                )
+            for future in futures:
+                future.result()
     else:
         # Find target session (could be regular session or workspace)
         session_data = sessions.get(target)
@@ -464,6 +589,12 @@ def list_sessions():
         typer.secho("No active sessions or workspaces.", fg="yellow")
         return
 
+    # Rich is only needed for listing; importing it lazily keeps startup fast
+    # for every other command.
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
+
     console = Console()
     table = Table(title="Par Development Contexts (Global)")
     table.add_column("Label", style="cyan", no_wrap=True)
@@ -474,6 +605,7 @@ def list_sessions():
     table.add_column("Created", style="dim")
 
     # Add all sessions (including workspaces)
+    rows = []
     for label, data in sorted(sessions.items()):
         session_active = (
             "✅" if operations.tmux_session_exists(data["tmux_session_name"]) else "❌"
@@ -490,15 +622,22 @@ def list_sessions():
             # Display regular session info
             repo_display = f"{data['repository_name']} ({Path(data['repository_path']).parent.name})"
 
-        table.add_row(
-            label,
-            session_type.title(),
-            repo_display,
-            f"{data['tmux_session_name']} ({session_active})",
-            data["branch_name"],
-            data["created_at"][:16],  # Just date and time
+        rows.append(
+            (
+                label,
+                session_type.title(),
+                repo_display,
+                f"{data['tmux_session_name']} ({session_active})",
+                data["branch_name"],
+                data["created_at"][:16],  # Just date and time
+            )
         )
 
+    # Cells are plain data, so hand Rich Text objects and skip markup parsing.
+    # This also keeps labels or branches containing '[...]' from being read as markup.
+    for row in rows:
+        table.add_row(*(Text(cell) for cell in row))
+
     console.print(table)
 
 
@@ -508,8 +647,11 @@ def open_session(label: str):
     if label == "-":
         label = _resolve_previous_session_label()
 
+    # Look the label up in sessions and legacy workspaces from one state load
+    state = _load_global_state()
+
     # Try sessions first
-    session_data = _get_session(label)
+    session_data = state["sessions"].get(label)
     if session_data:
         session_name = session_data["tmux_session_name"]
 
@@ -519,17 +661,20 @@ def open_session(label: str):
                 session_name, Path(session_data["worktree_path"])
             )
 
-        operations.open_tmux_session(session_name)
-        # Track this session as the last opened
+        # Track this session as the last opened. This must happen before
+        # attaching: outside tmux, attaching replaces the par process.
         _update_last_session(label)
+        operations.open_tmux_session(session_name)
         return
 
     # Try workspaces
-    workspace_data = _get_workspace(label)
+    workspace_data = state["workspaces"].get(label)
     if workspace_data:
-        workspace.open_workspace_session(label)
+        from . import workspace
+
         # Track this workspace as the last opened
         _update_last_session(label)
+        workspace.open_workspace_session(label)
         return
 
     typer.secho(f"Error: Session or workspace '{label}' not found.", fg="red", err=True)
@@ -620,46 +765,27 @@ def open_control_center():
         typer.secho("No sessions or workspaces to display.", fg="yellow")
         return
 
-    # Collect all repositories to determine naming strategy
-    all_repos = set()
-
-    # Collect repo names from all sessions
+    # Work out each session's repo prefix and starting directory in one pass
+    entries = []
     for label, data in sessions.items():
-        session_type = data.get("session_type", "session")
-        if session_type == "workspace":
-            # For workspaces, just add the workspace name
-            all_repos.add(f"workspace-{label}")
+        if data.get("session_type", "session") == "workspace":
+            # Workspaces get one window starting from the workspace root
+            entries.append((label, f"workspace-{label}", data["repository_path"], "workspace"))
         else:
-            # For regular sessions, use repository name
-            all_repos.add(data['repository_name'])
+            entries.append((label, data["repository_name"], data["worktree_path"], "session"))
 
     # Determine if we need to include repo names (more than one unique repo)
-    include_repo_name = len(all_repos) > 1
+    include_repo_name = len({prefix for _, prefix, _, _ in entries}) > 1
 
     # Prepare all contexts for control center
     active_contexts = []
-
-    # Process all sessions
-    for label, data in sessions.items():
-        session_type = data.get("session_type", "session")
-
-        if session_type == "workspace":
-            # For workspaces, create single window starting from workspace root
-            workspace_root = data["repository_path"]  # This is the workspace root directory
-            name = f"workspace-{label}" if include_repo_name else label
-            active_contexts.append({
-                "name": name,
-                "path": workspace_root,
-                "type": "workspace"
-            })
+    for label, prefix, path, context_type in entries:
+        if not include_repo_name:
+            name = label
+        elif context_type == "workspace":
+            name = prefix
         else:
-            # For regular sessions, create single window
-            repo_name = data['repository_name']
-            name = f"{repo_name}-{label}" if include_repo_name else label
-            active_contexts.append({
-                "name": name,
-                "path": data["worktree_path"],
-                "type": "session"
-            })
+            name = f"{prefix}-{label}"
+        active_contexts.append({"name": name, "path": path, "type": context_type})
 
     operations.open_control_center(active_contexts)
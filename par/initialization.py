@@ -1,26 +1,56 @@
 """Initialization support for .par.yaml configuration files."""
 
 import glob
+import shlex
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 import typer
-import yaml
-from rich.console import Console
 
 from . import operations
 
+# Parsed .par.yaml files keyed on path, reused while the file's mtime and size are
+# unchanged. Callers must treat the returned config as read-only.
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+# Configs larger than this are almost certainly not hand-written and are skipped
+_MAX_PAR_YAML_BYTES = 1 << 20
+
 
 def load_par_config(repo_root: Path) -> Optional[Dict[str, Any]]:
     """Load .par.yaml configuration from repository root."""
     config_file = repo_root / ".par.yaml"
-    if not config_file.exists():
+    # A single stat both detects a missing config and feeds the cache signature
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
         return None
+    if stat.st_size > _MAX_PAR_YAML_BYTES:
+        typer.secho(
+            f"Warning: .par.yaml is larger than {_MAX_PAR_YAML_BYTES} bytes; skipping",
+            fg="yellow",
+        )
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(config_file)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    # Imported here so commands that never parse a config skip loading PyYAML
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
     try:
-        with open(config_file, "r") as f:
-            return yaml.safe_load(f)
+        with open(config_file, "rb") as f:
+            config = yaml.load(f, Loader=loader)
+        _CONFIG_CACHE[config_file] = (signature, config)
+        return config
+    except FileNotFoundError:
+        # Removed between the stat and the open
+        return None
     except yaml.YAMLError as e:
         typer.secho(f"Warning: Invalid .par.yaml file: {e}", fg="yellow")
         return None
@@ -33,8 +63,10 @@ def copy_included_files(
     config: Dict[str, Any], repo_root: Path, worktree_path: Path
 ) -> None:
     """Copy files listed in the initialization.include section."""
-    initialization = config.get("initialization", {})
-    includes: Iterable[str] = initialization.get("include", [])
+    initialization = config.get("initialization")
+    if not isinstance(initialization, dict):
+        return
+    includes: Iterable[str] = initialization.get("include") or []
     for pattern in includes:
         # Expand pattern relative to the repository root
         full_pattern = str(repo_root / pattern)
@@ -52,6 +84,7 @@ def copy_included_files(
                 dest.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copy2(src_path, dest)
 
+
 def run_initialization(
     config: Dict[str, Any],
     session_name: str,
@@ -59,17 +92,21 @@ def run_initialization(
     workspace_mode: bool = False,
 ) -> None:
     """Run initialization commands from .par.yaml configuration."""
-    initialization = config.get("initialization", {})
-    commands = initialization.get("commands", [])
+    # An empty 'initialization:' or 'commands:' key parses as None
+    initialization = config.get("initialization")
+    commands = initialization.get("commands") if isinstance(initialization, dict) else None
 
     if not commands:
         return
 
+    from rich.console import Console
+
     console = Console()
     console.print(
         f"[cyan]Running initialization commands for session '{session_name}'...[/cyan]"
     )
 
+    full_commands = []
     for i, command_config in enumerate(commands):
         if isinstance(command_config, str):
             # Simple string command
@@ -95,19 +132,22 @@ def run_initialization(
         console.print(f"[green]Running:[/green] {name}")
 
         # Always cd to worktree root first to ensure consistent starting point
-        full_command = f"cd {worktree_path} && {command}"
+        full_command = f"cd {shlex.quote(str(worktree_path))} && {command}"
 
         # In workspace mode, show which repo we're running in
         if workspace_mode:
             console.print(f"[dim]  Repo: {worktree_path.name}[/dim]")
 
         console.print(f"[dim]  Command: {command}[/dim]")
+        full_commands.append(full_command)
 
+    # Send every command in one tmux call. Commands are newline-separated, so
+    # the shell still runs them one by one and a failure does not stop the rest.
+    if full_commands:
         try:
-            operations.send_tmux_keys(session_name, full_command)
+            operations.send_tmux_keys(session_name, "\n".join(full_commands))
         except Exception as e:
-            typer.secho(f"Error running command '{name}': {e}", fg="red")
-            # Continue with other commands even if one fails
+            typer.secho(f"Error running initialization commands: {e}", fg="red")
 
     console.print(
         f"[green]✅ Initialization complete for session '{session_name}'[/green]"
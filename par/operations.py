@@ -1,26 +1,54 @@
 """Git and tmux operations - simplified from git.py and tmux.py"""
 
 import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import typer
 
 from .checkout import CheckoutStrategy
 from .utils import get_git_repo_root, run_cmd
 
-
 # Tmux utilities
+# Set once tmux has been found; availability cannot change within one par run
+_tmux_checked = False
+
+
 def _check_tmux():
-    """Ensure tmux is available and running."""
-    try:
-        run_cmd(
-            ["tmux", "has-session"], check=False, capture=True, suppress_output=True
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        typer.secho("Error: tmux not available or not running.", fg="red", err=True)
+    """Ensure tmux is available."""
+    global _tmux_checked
+    if _tmux_checked:
+        return
+    if shutil.which("tmux") is None:
+        typer.secho("Error: tmux executable not found on PATH.", fg="red", err=True)
         raise typer.Exit(1)
+    _tmux_checked = True
+
+
+def run_tmux_batch(commands: List[List[str]], check: bool = True) -> subprocess.CompletedProcess:
+    """Run several tmux commands in a single tmux invocation.
+
+    Commands are joined with tmux's ``;`` separator so the whole sequence
+    costs one process spawn instead of one per command.
+    """
+    argv = ["tmux"]
+    for i, command in enumerate(commands):
+        if i:
+            argv.append(";")
+        argv.extend(_escape_tmux_arg(arg) for arg in command)
+    return run_cmd(argv, check=check)
+
+
+def _escape_tmux_arg(arg: str) -> str:
+    """Escape a trailing ';' so tmux keeps it rather than splitting the command.
+
+    tmux treats any argument ending in ';' as a command separator, and turns
+    a trailing '\\;' back into a literal ';'.
+    """
+    return arg[:-1] + "\\;" if arg.endswith(";") else arg
 
 
 def get_current_tmux_session() -> Optional[str]:
@@ -39,6 +67,11 @@ def get_current_tmux_session() -> Optional[str]:
 
 
 # Git operations
+# Populate new worktrees with parallel checkout on all cores (git >= 2.32; older
+# versions ignore the setting). Git still checks out small trees sequentially.
+_WORKTREE_ADD = ["git", "-c", "checkout.workers=0", "worktree", "add"]
+
+
 def _resolve_base_ref(repo_root: Path, base_branch: str) -> str:
     """Resolve a branch/reference to its commit SHA."""
     try:
@@ -69,7 +102,7 @@ def create_worktree(
         repo_root = get_git_repo_root()
 
     def _build_worktree_add_cmd(use_create_branch: bool) -> list[str]:
-        cmd = ["git", "worktree", "add"]
+        cmd = list(_WORKTREE_ADD)
         if use_create_branch:
             cmd.extend(["-b", label])
         cmd.append(str(worktree_path))
@@ -137,7 +170,7 @@ def fetch_remote_branch(
 
     try:
         run_cmd(
-            ["git", "fetch", remote, branch_name],
+            ["git", "fetch", "--no-tags", remote, branch_name],
             cwd=repo_root,
             suppress_output=True,
         )
@@ -146,8 +179,8 @@ def fetch_remote_branch(
         return False
 
 
-def remove_worktree(worktree_path: Path, repo_root: Optional[Path] = None):
-    """Remove a git worktree."""
+def remove_worktree(worktree_path: Path, repo_root: Optional[Path] = None) -> bool:
+    """Remove a git worktree. Returns True when git removed it."""
     if repo_root is None:
         repo_root = get_git_repo_root()
 
@@ -156,9 +189,10 @@ def remove_worktree(worktree_path: Path, repo_root: Optional[Path] = None):
     try:
         run_cmd(cmd, cwd=repo_root, suppress_output=True)
         typer.secho(f"Removed worktree at {worktree_path}", fg="green")
+        return True
     except Exception:
         # Often fails if path doesn't exist - that's OK during cleanup
-        pass
+        return False
 
 
 def checkout_worktree(
@@ -177,11 +211,13 @@ def checkout_worktree(
             typer.secho(f"Fetching PR #{pr_number}...", fg="cyan")
 
             # Fetch the specific PR ref
-            fetch_cmd = ["git", "fetch", strategy.remote, f"pull/{pr_number}/head"]
+            fetch_cmd = [
+                "git", "fetch", "--no-tags", strategy.remote, f"pull/{pr_number}/head"
+            ]
             run_cmd(fetch_cmd, cwd=repo_root, suppress_output=True)
 
             # Create worktree directly from FETCH_HEAD (what we just fetched)
-            cmd = ["git", "worktree", "add", str(worktree_path), "FETCH_HEAD"]
+            cmd = [*_WORKTREE_ADD, str(worktree_path), "FETCH_HEAD"]
 
         except Exception as e:
             typer.secho(f"Failed to fetch PR #{pr_number}: {e}", fg="red", err=True)
@@ -190,9 +226,13 @@ def checkout_worktree(
     elif strategy.fetch_remote:
         try:
             typer.secho(f"Fetching from remote '{strategy.remote}'...", fg="cyan")
-            run_cmd(
-                ["git", "fetch", strategy.remote], cwd=repo_root, suppress_output=True
-            )
+            fetch_cmd = ["git", "fetch", "--no-tags", strategy.remote]
+            # Fetch just the branch being checked out rather than the whole
+            # remote; git still updates its remote-tracking ref.
+            remote_prefix = f"{strategy.remote}/"
+            if strategy.ref.startswith(remote_prefix):
+                fetch_cmd.append(strategy.ref[len(remote_prefix):])
+            run_cmd(fetch_cmd, cwd=repo_root, suppress_output=True)
         except Exception as e:
             typer.secho(
                 f"Warning: Could not fetch from '{strategy.remote}': {e}", fg="yellow"
@@ -200,10 +240,10 @@ def checkout_worktree(
             # Continue anyway - the branch might already exist locally
 
         # Create worktree from existing ref
-        cmd = ["git", "worktree", "add", str(worktree_path), strategy.ref]
+        cmd = [*_WORKTREE_ADD, str(worktree_path), strategy.ref]
     else:
         # Create worktree from existing ref
-        cmd = ["git", "worktree", "add", str(worktree_path), strategy.ref]
+        cmd = [*_WORKTREE_ADD, str(worktree_path), strategy.ref]
 
     try:
         run_cmd(cmd, cwd=repo_root)
@@ -235,16 +275,45 @@ def delete_branch(branch_name: str, repo_root: Optional[Path] = None):
 
 
 # Tmux operations
+# Names of running tmux sessions, listed once and reused for existence checks.
+# Helpers that create or kill sessions reset it.
+_session_set_cache: Optional[Set[str]] = None
+
+
+def _session_set() -> Set[str]:
+    """Get the cached set of running tmux session names."""
+    global _session_set_cache
+    if _session_set_cache is None:
+        # No server running means no sessions
+        _session_set_cache = get_live_tmux_sessions() or set()
+    return _session_set_cache
+
+
+def _invalidate_session_set():
+    global _session_set_cache
+    _session_set_cache = None
+
+
 def tmux_session_exists(session_name: str) -> bool:
     """Check if a tmux session exists."""
+    return session_name in _session_set()
+
+
+def get_live_tmux_sessions() -> Optional[Set[str]]:
+    """Get the names of all running tmux sessions with a single tmux call.
+
+    Returns None if the sessions could not be listed (e.g. no tmux server).
+    """
     _check_tmux()
     result = run_cmd(
-        ["tmux", "has-session", "-t", session_name],
+        ["tmux", "list-sessions", "-F", "#{session_name}"],
         check=False,
         capture=True,
         suppress_output=True,
     )
-    return result.returncode == 0
+    if result.returncode != 0:
+        return None
+    return set(result.stdout.splitlines())
 
 
 def create_tmux_session(session_name: str, worktree_path: Path):
@@ -252,6 +321,7 @@ def create_tmux_session(session_name: str, worktree_path: Path):
     _check_tmux()
     cmd = ["tmux", "new-session", "-d", "-s", session_name, "-c", str(worktree_path)]
 
+    _invalidate_session_set()
     try:
         run_cmd(cmd)
         typer.secho(f"Created tmux session '{session_name}'", fg="green")
@@ -267,6 +337,7 @@ def kill_tmux_session(session_name: str):
     _check_tmux()
     cmd = ["tmux", "kill-session", "-t", session_name]
 
+    _invalidate_session_set()
     try:
         run_cmd(cmd, check=False, suppress_output=True)
     except Exception:
@@ -308,44 +379,58 @@ def _update_control_center_windows(session_name: str, contexts_data: List[dict])
     # Get current windows in the control center session
     try:
         result = run_cmd([
-            "tmux", "list-windows", "-t", session_name, "-F", "#{window_index}:#{window_name}"
+            "tmux", "list-windows", "-t", session_name, "-F", "#{window_id}\t#{window_name}"
         ], capture=True)
         current_windows = {}
-        for line in result.stdout.strip().split('\n'):
-            if ':' in line:
-                index, name = line.split(':', 1)
-                current_windows[name] = int(index)
+        for line in result.stdout.splitlines():
+            window_id, sep, name = line.partition("\t")
+            if sep:
+                current_windows[name] = window_id
     except Exception:
         # If we can't get windows, fall back to recreating the session
+        _invalidate_session_set()
         run_cmd(["tmux", "kill-session", "-t", session_name], check=False)
         return False
 
     # Build expected windows from contexts
     expected_windows = {context["name"]: context for context in contexts_data}
 
-    # Remove windows that no longer exist
-    for window_name, window_index in current_windows.items():
-        if window_name not in expected_windows:
-            try:
-                run_cmd(["tmux", "kill-window", "-t", f"{session_name}:{window_index}"])
-            except Exception:
-                pass  # Window might already be gone
+    # Remove windows that no longer exist. Kill by window id, which stays valid
+    # as tmux renumbers windows, and one call per window: tmux abandons a
+    # ';'-joined command list at the first failure, so one window that is
+    # already gone would otherwise keep the rest alive. The kills are
+    # independent of each other, so they run concurrently.
+    stale_ids = [
+        window_id
+        for window_name, window_id in current_windows.items()
+        if window_name not in expected_windows
+    ]
+    if stale_ids:
+        with ThreadPoolExecutor(max_workers=min(16, len(stale_ids))) as executor:
+            for window_id in stale_ids:
+                # check=False: the window might already be gone
+                executor.submit(
+                    run_cmd,
+                    ["tmux", "kill-window", "-t", window_id],
+                    check=False,
+                    suppress_output=True,
+                )
 
-    # Add or update windows for current contexts
+    # Add windows for new contexts, in order so tmux assigns indices that follow
+    # the session list. If a window exists, we could update its working
+    # directory, but tmux doesn't have a direct command for this. The window
+    # will retain its original path.
     existing_names = set(current_windows.keys())
-    for i, context in enumerate(contexts_data):
-        if context["name"] not in existing_names:
-            # Create new window
-            run_cmd([
-                "tmux", "new-window", "-t", session_name,
-                "-n", context["name"], "-c", context["path"]
-            ])
-        # If window exists, we could update its working directory, but tmux doesn't
-        # have a direct command for this. The window will retain its original path.
-
+    commands = [
+        ["new-window", "-t", session_name, "-n", context["name"], "-c", context["path"]]
+        for context in contexts_data
+        if context["name"] not in existing_names
+    ]
     # Ensure we have at least one window and select the first one
     if contexts_data:
-        run_cmd(["tmux", "select-window", "-t", f"{session_name}:^"], check=False)
+        commands.append(["select-window", "-t", f"{session_name}:^"])
+    if commands:
+        run_tmux_batch(commands)
 
     return True
 
@@ -376,24 +461,30 @@ def open_control_center(contexts_data: List[dict]):
             return
         # If update failed, fall through to recreate the session
 
-    # Create new control center session with first context
+    # Create the session, one window per context, and select the first window
+    # in a single tmux invocation
     first_context = contexts_data[0]
-    create_tmux_session(cc_session_name, Path(first_context["path"]))
-
-    # Rename first window
-    run_cmd([
-        "tmux", "rename-window", "-t", f"{cc_session_name}:0", first_context["name"]
-    ])
-
-    # Create additional windows for remaining contexts
+    commands = [
+        [
+            "new-session", "-d", "-s", cc_session_name,
+            "-n", first_context["name"], "-c", first_context["path"],
+        ]
+    ]
     for context in contexts_data[1:]:
-        run_cmd([
-            "tmux", "new-window", "-t", cc_session_name,
-            "-n", context["name"], "-c", context["path"]
+        commands.append([
+            "new-window", "-t", cc_session_name,
+            "-n", context["name"], "-c", context["path"],
         ])
+    commands.append(["select-window", "-t", f"{cc_session_name}:^"])
 
-    # Select window 0 before attaching
-    run_cmd(["tmux", "select-window", "-t", f"{cc_session_name}:0"])
+    _invalidate_session_set()
+    try:
+        run_tmux_batch(commands)
+    except Exception as e:
+        typer.secho(
+            f"Failed to create tmux session '{cc_session_name}': {e}", fg="red", err=True
+        )
+        raise typer.Exit(1)
 
     typer.secho(f"Created control center with {len(contexts_data)} windows.", fg="green")
     open_tmux_session(cc_session_name)
@@ -403,7 +494,7 @@ def create_workspace_worktree(
     repo_path: Path, label: str, worktree_path: Path, base_branch: Optional[str] = None
 ):
     """Create a new git worktree and branch for a specific repo in workspace."""
-    cmd = ["git", "worktree", "add", "-b", label, str(worktree_path)]
+    cmd = [*_WORKTREE_ADD, "-b", label, str(worktree_path)]
     if base_branch:
         cmd.append(base_branch)
 
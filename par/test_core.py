@@ -0,0 +1,371 @@
+"""Tests for par core session state handling."""
+
+import os
+from pathlib import Path
+from unittest.mock import call, patch
+
+import pytest
+import typer
+
+from . import core
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point par's data directory at a temporary location."""
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    return tmp_path / "par"
+
+
+def _session(label: str, session_type: str = "session") -> dict:
+    return {
+        "label": label,
+        "repository_path": "/tmp/repo",
+        "repository_name": "repo",
+        "worktree_path": f"/tmp/worktrees/{label}",
+        "tmux_session_name": f"par-repo-1234-{label}",
+        "branch_name": label,
+        "created_at": "2025-01-01T00:00:00",
+        "session_type": session_type,
+    }
+
+
+@patch("par.core.typer.confirm", return_value=True)
+@patch("par.core._remove_session_resources")
+def test_remove_all_sessions_saves_state_once(
+    mock_remove_resources, _mock_confirm, data_dir
+):
+    """Removing all sessions cleans up each one but persists state a single time."""
+    for label in ("one", "two", "three"):
+        core._add_session(_session(label))
+
+    with patch(
+        "par.core._save_global_state", wraps=core._save_global_state
+    ) as mock_save:
+        core.remove_all_sessions()
+
+    assert mock_remove_resources.call_count == 3
+    mock_save.assert_called_once()
+    assert core._get_all_sessions() == {}
+
+
+@patch("par.core.typer.confirm", return_value=True)
+@patch("par.core._remove_session_resources")
+def test_remove_all_sessions_persists_partial_progress(
+    mock_remove_resources, _mock_confirm, data_dir
+):
+    """If cleanup fails midway, sessions already removed stay removed."""
+    core._add_session(_session("one"))
+    core._add_session(_session("two"))
+    mock_remove_resources.side_effect = [None, RuntimeError("boom")]
+
+    with pytest.raises(RuntimeError):
+        core.remove_all_sessions()
+
+    assert list(core._get_all_sessions()) == ["two"]
+
+
+def test_update_last_session_skips_write_when_unchanged(data_dir):
+    """Re-opening the last session does not rewrite global state."""
+    core._update_last_session("one")
+    core._update_last_session("two")
+
+    with patch("par.core._save_global_state") as mock_save:
+        core._update_last_session("two")
+
+    mock_save.assert_not_called()
+    state = core._load_global_state()
+    assert state["last_session"] == "two"
+    assert state["previous_session"] == "one"
+
+
+def test_load_global_state_reuses_parsed_state_until_file_changes(data_dir):
+    """Unchanged state files are parsed once; external edits are picked up."""
+    core._add_session(_session("one"))
+
+    first = core._load_global_state()
+    assert core._load_global_state() is first
+
+    state_file = core._get_global_state_file()
+    state_file.write_text('{"sessions": {"other": {}}, "workspaces": {}}')
+
+    reloaded = core._load_global_state()
+    assert reloaded is not first
+    assert list(reloaded["sessions"]) == ["other"]
+
+
+def test_load_global_state_detects_replacement_with_same_mtime_and_size(data_dir):
+    """A file swapped in by another process is reloaded even if mtime and size match."""
+    core._add_session(_session("one"))
+    state_file = core._get_global_state_file()
+    first = core._load_global_state()
+    before = state_file.stat()
+
+    # Another par process renames a same-sized file into place within one mtime tick
+    replacement = state_file.with_name("replacement.json")
+    replacement.write_text(state_file.read_text().replace('"one"', '"two"'))
+    os.utime(replacement, ns=(before.st_atime_ns, before.st_mtime_ns))
+    replacement.replace(state_file)
+
+    reloaded = core._load_global_state()
+    assert reloaded is not first
+    assert list(reloaded["sessions"]) == ["two"]
+
+
+@patch("par.core.operations.send_tmux_keys", autospec=True)
+def test_send_command_all_sessions(mock_send_keys, data_dir):
+    """Sending to 'all' reaches every tracked session."""
+    core._add_session(_session("one"))
+    core._add_session(_session("two", session_type="workspace"))
+
+    core.send_command("all", "git status")
+
+    assert mock_send_keys.call_count == 2
+    mock_send_keys.assert_has_calls(
+        [
+            call("par-repo-1234-one", "git status"),
+            call("par-repo-1234-two", "git status"),
+        ],
+        any_order=True,
+    )
+
+
+@patch(
+    "par.core.operations.get_live_tmux_sessions",
+    return_value={"par-repo-1234-one"},
+    autospec=True,
+)
+def test_list_sessions_checks_tmux_once(mock_live_sessions, data_dir, monkeypatch):
+    """Listing sessions uses one batched tmux query rather than one per session."""
+    monkeypatch.setattr(core.operations, "_session_set_cache", None)
+    core._add_session(_session("one"))
+    core._add_session(_session("two"))
+
+    core.list_sessions()
+
+    mock_live_sessions.assert_called_once()
+
+
+@patch("par.core.operations.open_tmux_session", autospec=True)
+@patch("par.core.operations.tmux_session_exists", return_value=True, autospec=True)
+def test_open_session_records_last_session_before_attaching(
+    _mock_session_exists, mock_open_tmux, data_dir
+):
+    """Last-session tracking is written before tmux takes over the process."""
+    core._add_session(_session("one"))
+
+    def _attach(_session_name):
+        assert core._load_global_state()["last_session"] == "one"
+
+    mock_open_tmux.side_effect = _attach
+
+    core.open_session("one")
+
+    mock_open_tmux.assert_called_once_with("par-repo-1234-one")
+
+
+def test_save_global_state_replaces_file_atomically(data_dir):
+    """Saving state leaves only the final file behind."""
+    core._add_session(_session("one"))
+
+    state_dir = core._get_global_state_file().parent
+    assert [
+        p.name for p in state_dir.iterdir() if p.name.startswith("global_state")
+    ] == ["global_state.json"]
+    assert list(core._load_global_state()["sessions"]) == ["one"]
+
+
+@patch("par.core.operations.tmux_session_exists", return_value=False, autospec=True)
+def test_list_sessions_does_not_interpret_markup(
+    _mock_session_exists, data_dir, capsys
+):
+    """Labels that look like Rich markup are printed verbatim."""
+    core._add_session(_session("fix-[bold]"))
+
+    core.list_sessions()
+
+    assert "fix-[bold]" in capsys.readouterr().out
+
+
+@patch("par.core._remove_session_resources")
+def test_remove_session_updates_state(mock_remove_resources, data_dir):
+    """Removing one session cleans it up and drops only that entry."""
+    core._add_session(_session("one"))
+    core._add_session(_session("two"))
+
+    core.remove_session("one")
+
+    mock_remove_resources.assert_called_once()
+    assert list(core._get_all_sessions()) == ["two"]
+
+
+@patch("par.core.shutil.rmtree")
+@patch("par.core.operations.delete_branch", autospec=True)
+@patch("par.core.operations.remove_worktree", return_value=True, autospec=True)
+@patch("par.core.operations.kill_tmux_session", autospec=True)
+def test_remove_regular_session_skips_rmtree_after_git_removal(
+    _mock_kill, _mock_remove_worktree, _mock_delete_branch, mock_rmtree, data_dir
+):
+    """When git already removed the worktree there is no directory left to delete."""
+    session_data = _session("one")
+    session_data["worktree_path"] = str(data_dir / "worktrees" / "abc" / "one")
+
+    core._remove_regular_session(session_data)
+
+    mock_rmtree.assert_not_called()
+
+
+def test_migrate_legacy_state(data_dir):
+    """Legacy per-repo state files are folded into global state."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "state.json").write_text(
+        '{"/tmp/repo": {"one": {"worktree_path": "/tmp/wt/one",'
+        ' "tmux_session_name": "par-repo-one", "branch_name": "one",'
+        ' "created_at": "2025-01-01T00:00:00"}}}'
+    )
+    (data_dir / "workspaces.json").write_text("")
+
+    migrated = core._migrate_legacy_state()
+
+    assert migrated["sessions"]["one"]["repository_name"] == "repo"
+    assert migrated["sessions"]["one"]["session_type"] == "session"
+    assert migrated["workspaces"] == {}
+
+
+@patch("par.core.operations.open_control_center", autospec=True)
+def test_open_control_center_names_windows(mock_open_cc, data_dir):
+    """Window names include the repo prefix only when several repos are open."""
+    core._add_session(_session("one"))
+    core._add_session(_session("ws", session_type="workspace"))
+
+    core.open_control_center()
+
+    contexts = mock_open_cc.call_args.args[0]
+    assert [c["name"] for c in contexts] == ["repo-one", "workspace-ws"]
+    assert [c["type"] for c in contexts] == ["session", "workspace"]
+
+
+@patch("par.core.operations.delete_branch", autospec=True)
+@patch("par.core.operations.remove_worktree", autospec=True)
+@patch("par.core.operations.kill_tmux_session", autospec=True)
+def test_remove_workspace_session_cleans_every_repo(
+    mock_kill, mock_remove_worktree, mock_delete_branch, data_dir
+):
+    """Each repo in a workspace loses its worktree and branch."""
+    session_data = _session("ws", session_type="workspace")
+    session_data["workspace_repos"] = [
+        {
+            "repo_name": name,
+            "repo_path": f"/tmp/{name}",
+            "worktree_path": f"/tmp/ws/{name}",
+            "branch_name": "ws",
+        }
+        for name in ("api", "web")
+    ]
+
+    core._remove_workspace_session(session_data)
+
+    mock_kill.assert_called_once_with("par-repo-1234-ws")
+    assert sorted(c.args for c in mock_remove_worktree.call_args_list) == [
+        (Path("/tmp/ws/api"), Path("/tmp/api")),
+        (Path("/tmp/ws/web"), Path("/tmp/web")),
+    ]
+    assert sorted(c.args for c in mock_delete_branch.call_args_list) == [
+        ("ws", Path("/tmp/api")),
+        ("ws", Path("/tmp/web")),
+    ]
+
+
+def test_save_global_state_writes_through_cache(data_dir):
+    """A load right after a save reuses the saved state without parsing."""
+    core._add_session(_session("one"))
+    state = core._load_global_state()
+    state["sessions"]["two"] = _session("two")
+    core._save_global_state(state)
+
+    with patch("par.core.json.loads") as mock_loads:
+        assert core._load_global_state() is state
+
+    mock_loads.assert_not_called()
+
+
+def test_save_global_state_skips_unchanged_content(data_dir):
+    """Saving state identical to what is on disk leaves the file untouched."""
+    core._add_session(_session("one"))
+    state_file = core._get_global_state_file()
+    before = state_file.stat()
+
+    core._save_global_state(core._load_global_state())
+
+    after = state_file.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+
+@patch("par.core.utils.resolve_repository_path")
+def test_start_session_rejects_duplicate_label(mock_resolve_repo, data_dir):
+    """Starting a session under an existing label exits before touching the repo."""
+    core._add_session(_session("one"))
+
+    with pytest.raises(typer.Exit) as exc_info:
+        core.start_session("one")
+
+    assert exc_info.value.exit_code == 1
+    mock_resolve_repo.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("tmux_exists", "expects_create"),
+    [
+        pytest.param(True, False, id="existing"),
+        pytest.param(False, True, id="recreate"),
+    ],
+)
+@patch("par.core.operations.open_tmux_session", autospec=True)
+@patch("par.core.operations.create_tmux_session", autospec=True)
+@patch("par.core.operations.tmux_session_exists", autospec=True)
+def test_open_session(
+    mock_session_exists,
+    mock_create_tmux,
+    mock_open_tmux,
+    tmux_exists,
+    expects_create,
+    data_dir,
+):
+    """Open attaches to a known session, recreating its tmux session if needed."""
+    core._add_session(_session("one"))
+    mock_session_exists.return_value = tmux_exists
+
+    core.open_session("one")
+
+    assert mock_create_tmux.called is expects_create
+    mock_open_tmux.assert_called_once_with("par-repo-1234-one")
+
+
+@patch("par.core.operations.open_tmux_session", autospec=True)
+def test_open_session_unknown_label_exits(mock_open_tmux, data_dir):
+    """Opening a label that is not tracked exits without attaching."""
+    with pytest.raises(typer.Exit):
+        core.open_session("one")
+
+    mock_open_tmux.assert_not_called()
+
+
+@patch("par.core.typer.confirm", side_effect=typer.Abort())
+def test_remove_all_sessions_cancelled(_mock_confirm, data_dir):
+    """Declining the confirmation leaves every session in place."""
+    core._add_session(_session("one"))
+
+    with pytest.raises(typer.Abort):
+        core.remove_all_sessions()
+
+    assert list(core._get_all_sessions()) == ["one"]
+
+
+def test_load_global_state_treats_whitespace_as_empty(data_dir, capsys):
+    """A state file holding only whitespace loads as empty state without a warning."""
+    state_file = core._get_global_state_file()
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    state_file.write_text("\n")
+
+    assert core._load_global_state() == {"sessions": {}, "workspaces": {}}
+    assert "corrupted" not in capsys.readouterr().out
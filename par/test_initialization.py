@@ -1,99 +1,68 @@
 """Tests for par initialization functionality."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from . import initialization
 
 
-def test_load_par_config_missing_file():
+def test_load_par_config_missing_file(tmp_path):
     """Test loading config when .par.yaml doesn't exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_root = Path(tmpdir)
-        config = initialization.load_par_config(repo_root)
-        assert config is None
+    config = initialization.load_par_config(tmp_path)
+    assert config is None
 
 
-def test_load_par_config_valid_yaml():
+def test_load_par_config_valid_yaml(tmp_path):
     """Test loading valid .par.yaml config."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_root = Path(tmpdir)
-        config_file = repo_root / ".par.yaml"
+    config_file = tmp_path / ".par.yaml"
 
-        config_content = """
+    config_content = """
 initialization:
   commands:
     - name: "Install deps"
       command: "npm install"
     - "echo hello"
 """
-        config_file.write_text(config_content)
+    config_file.write_text(config_content)
 
-        config = initialization.load_par_config(repo_root)
-        assert config is not None
-        assert "initialization" in config
-        assert len(config["initialization"]["commands"]) == 2
+    config = initialization.load_par_config(tmp_path)
+    assert config is not None
+    assert "initialization" in config
+    assert len(config["initialization"]["commands"]) == 2
 
 
-def test_load_par_config_invalid_yaml():
+def test_load_par_config_invalid_yaml(tmp_path):
     """Test loading invalid YAML."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_root = Path(tmpdir)
-        config_file = repo_root / ".par.yaml"
-
-        # Invalid YAML (unclosed bracket)
-        config_file.write_text("initialization:\n  commands: [")
+    config_file = tmp_path / ".par.yaml"
 
-        config = initialization.load_par_config(repo_root)
-        assert config is None
+    # Invalid YAML (unclosed bracket)
+    config_file.write_text("initialization:\n  commands: [")
 
+    config = initialization.load_par_config(tmp_path)
+    assert config is None
 
-@patch("par.initialization.operations.send_tmux_keys")
-def test_run_initialization_string_commands(mock_send_keys):
-    """Test running simple string commands."""
-    config = {"initialization": {"commands": ["npm install", "echo hello"]}}
 
-    worktree_path = Path("/tmp/test-worktree")
-    initialization.run_initialization(config, "test-session", worktree_path)
-
-    assert mock_send_keys.call_count == 2
-    mock_send_keys.assert_any_call(
-        "test-session", "cd /tmp/test-worktree && npm install"
-    )
-    mock_send_keys.assert_any_call(
-        "test-session", "cd /tmp/test-worktree && echo hello"
-    )
-
-
-@patch("par.initialization.operations.send_tmux_keys")
-def test_run_initialization_structured_commands(mock_send_keys):
-    """Test running structured commands with names."""
-    config = {
-        "initialization": {
-            "commands": [
+@pytest.mark.parametrize(
+    ("commands", "expected"),
+    [
+        pytest.param(
+            ["npm install", "echo hello"],
+            "cd /tmp/test-worktree && npm install\ncd /tmp/test-worktree && echo hello",
+            id="string-commands",
+        ),
+        pytest.param(
+            [
                 {"name": "Install dependencies", "command": "npm install"},
                 {"name": "Start server", "command": "npm start"},
-            ]
-        }
-    }
-
-    worktree_path = Path("/tmp/test-worktree")
-    initialization.run_initialization(config, "test-session", worktree_path)
-
-    assert mock_send_keys.call_count == 2
-    mock_send_keys.assert_any_call(
-        "test-session", "cd /tmp/test-worktree && npm install"
-    )
-    mock_send_keys.assert_any_call("test-session", "cd /tmp/test-worktree && npm start")
-
-
-@patch("par.initialization.operations.send_tmux_keys")
-def test_run_initialization(mock_send_keys):
-    """Test initialization with multiple commands."""
-    config = {
-        "initialization": {
-            "commands": [
+            ],
+            "cd /tmp/test-worktree && npm install\ncd /tmp/test-worktree && npm start",
+            id="structured-commands",
+        ),
+        pytest.param(
+            # Both commands should run (conditions are ignored)
+            [
                 {
                     "name": "Install frontend deps",
                     "command": "cd frontend && npm install",
@@ -102,59 +71,53 @@ def test_run_initialization(mock_send_keys):
                     "name": "Install backend deps",
                     "command": "cd backend && pip install -r requirements.txt",
                 },
-            ]
-        }
-    }
+            ],
+            "cd /tmp/test-worktree && cd frontend && npm install\n"
+            "cd /tmp/test-worktree && cd backend && pip install -r requirements.txt",
+            id="subdirectory-commands",
+        ),
+        pytest.param(
+            # Entries without a command, or of the wrong type, are skipped
+            [
+                "valid command",
+                {"name": "Missing command"},
+                123,
+                {"command": "valid command"},
+            ],
+            "cd /tmp/test-worktree && valid command\n"
+            "cd /tmp/test-worktree && valid command",
+            id="invalid-entries-skipped",
+        ),
+    ],
+)
+@patch("par.initialization.operations.send_tmux_keys")
+def test_run_initialization(mock_send_keys, commands, expected):
+    """Commands run from the worktree root, sent together in one tmux call."""
+    config = {"initialization": {"commands": commands}}
 
     worktree_path = Path("/tmp/test-worktree")
     initialization.run_initialization(config, "test-session", worktree_path)
 
-    # Both commands should run (conditions are ignored)
-    assert mock_send_keys.call_count == 2
-    mock_send_keys.assert_any_call(
-        "test-session", "cd /tmp/test-worktree && cd frontend && npm install"
-    )
-    mock_send_keys.assert_any_call(
-        "test-session",
-        "cd /tmp/test-worktree && cd backend && pip install -r requirements.txt",
-    )
+    mock_send_keys.assert_called_once_with("test-session", expected)
 
 
 @patch("par.initialization.operations.send_tmux_keys")
-def test_run_initialization_no_commands(mock_send_keys):
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param({"other": "settings"}, id="no-section"),
+        pytest.param({"initialization": None}, id="empty-section"),
+        pytest.param({"initialization": {"commands": None}}, id="empty-commands"),
+    ],
+)
+def test_run_initialization_no_commands(mock_send_keys, config):
     """Test with no initialization commands."""
-    config = {"other": "settings"}
-
     worktree_path = Path("/tmp/test-worktree")
     initialization.run_initialization(config, "test-session", worktree_path)
 
     assert mock_send_keys.call_count == 0
 
 
-@patch("par.initialization.operations.send_tmux_keys")
-def test_run_initialization_invalid_command_config(mock_send_keys):
-    """Test handling invalid command configurations."""
-    config = {
-        "initialization": {
-            "commands": [
-                "valid command",
-                {"name": "Missing command"},  # No command field
-                123,  # Invalid type
-                {"command": "valid command"},  # Valid
-            ]
-        }
-    }
-
-    worktree_path = Path("/tmp/test-worktree")
-    initialization.run_initialization(config, "test-session", worktree_path)
-
-    # Should only run the valid commands
-    assert mock_send_keys.call_count == 2
-    mock_send_keys.assert_any_call(
-        "test-session", "cd /tmp/test-worktree && valid command"
-    )
-
-
 def test_copy_included_files(tmp_path):
     """Files listed under include are copied to the worktree."""
     repo_root = tmp_path / "repo"
@@ -170,3 +133,55 @@ def test_copy_included_files(tmp_path):
 
     dest = worktree_path / ".env"
     assert dest.exists() and dest.read_text() == "SECRET=1"
+
+
+def test_load_par_config_reuses_parsed_config(tmp_path):
+    """An unchanged .par.yaml is parsed once and then served from cache."""
+    config_file = tmp_path / ".par.yaml"
+    config_file.write_text("initialization:\n  commands:\n    - echo hello\n")
+
+    first = initialization.load_par_config(tmp_path)
+    with patch("yaml.load") as mock_load:
+        second = initialization.load_par_config(tmp_path)
+
+    mock_load.assert_not_called()
+    assert second is first
+
+
+def test_load_par_config_reparses_changed_file(tmp_path):
+    """Edits to .par.yaml invalidate the cached config."""
+    config_file = tmp_path / ".par.yaml"
+    config_file.write_text("initialization:\n  commands:\n    - echo hello\n")
+    assert initialization.load_par_config(tmp_path)["initialization"]["commands"] == [
+        "echo hello"
+    ]
+
+    config_file.write_text("initialization:\n  commands:\n    - echo hello world\n")
+    assert initialization.load_par_config(tmp_path)["initialization"]["commands"] == [
+        "echo hello world"
+    ]
+
+
+def test_load_par_config_skips_oversized_file(tmp_path):
+    """A .par.yaml over the size cap is skipped without being parsed."""
+    config_file = tmp_path / ".par.yaml"
+    config_file.write_text(
+        "# padding\n" * (initialization._MAX_PAR_YAML_BYTES // 10 + 1)
+    )
+
+    with patch("yaml.load") as mock_load:
+        assert initialization.load_par_config(tmp_path) is None
+
+    mock_load.assert_not_called()
+
+
+@patch("par.initialization.operations.send_tmux_keys")
+def test_run_initialization_quotes_worktree_path(mock_send_keys):
+    """Worktree paths with spaces are quoted for the shell."""
+    config = {"initialization": {"commands": ["make"]}}
+
+    initialization.run_initialization(config, "test-session", Path("/tmp/my worktree"))
+
+    mock_send_keys.assert_called_once_with(
+        "test-session", "cd '/tmp/my worktree' && make"
+    )
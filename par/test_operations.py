@@ -0,0 +1,232 @@
+"""Tests for par tmux operations."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from . import operations
+from .checkout import CheckoutStrategy
+
+
+def _completed(stdout: str = "") -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(
+        args=["tmux"], returncode=0, stdout=stdout, stderr=""
+    )
+
+
+_WINDOW_LIST = "@1\tkeep\n@2\tstale-a\n@3\tstale-b\n@4\trepo:feature\n"
+_CONTEXTS = [
+    {"name": "keep", "path": "/tmp/keep", "type": "session"},
+    {"name": "repo:feature", "path": "/tmp/feature", "type": "session"},
+    {"name": "new", "path": "/tmp/new", "type": "session"},
+]
+
+
+@patch("par.operations.run_cmd")
+def test_update_control_center_windows_syncs_windows(mock_run_cmd):
+    """Stale windows are killed and missing contexts get new windows."""
+    mock_run_cmd.side_effect = lambda cmd, **kwargs: _completed(
+        _WINDOW_LIST if cmd[1] == "list-windows" else ""
+    )
+
+    assert (
+        operations._update_control_center_windows("control-center", _CONTEXTS) is True
+    )
+
+    commands = [call.args[0] for call in mock_run_cmd.call_args_list]
+    # Stale windows are killed concurrently, so their order is not fixed
+    assert sorted(commands[1:3]) == [
+        ["tmux", "kill-window", "-t", "@2"],
+        ["tmux", "kill-window", "-t", "@3"],
+    ]
+    assert commands[3:] == [
+        [
+            "tmux",
+            "new-window",
+            "-t",
+            "control-center",
+            "-n",
+            "new",
+            "-c",
+            "/tmp/new",
+            ";",
+            "select-window",
+            "-t",
+            "control-center:^",
+        ],
+    ]
+
+
+@patch("par.operations.run_cmd")
+def test_update_control_center_windows_continues_after_failed_kill(mock_run_cmd):
+    """A window that is already gone does not stop the other stale windows being killed."""
+
+    def _run(cmd, **kwargs):
+        if cmd[1] == "list-windows":
+            return _completed(_WINDOW_LIST)
+        if cmd[1:] == ["kill-window", "-t", "@2"]:
+            raise subprocess.CalledProcessError(1, cmd, stderr="can't find window: @2")
+        return _completed()
+
+    mock_run_cmd.side_effect = _run
+
+    assert (
+        operations._update_control_center_windows("control-center", _CONTEXTS) is True
+    )
+
+    commands = [call.args[0] for call in mock_run_cmd.call_args_list]
+    assert ["tmux", "kill-window", "-t", "@3"] in commands
+    assert commands[-1][:2] == ["tmux", "new-window"]
+
+
+@patch("par.operations.open_tmux_session")
+@patch("par.operations.tmux_session_exists", return_value=False)
+@patch("par.operations._check_tmux")
+@patch("par.operations.run_cmd")
+def test_open_control_center_uses_one_tmux_call(
+    mock_run_cmd, _mock_check_tmux, _mock_session_exists, mock_open_tmux, monkeypatch
+):
+    """A fresh control center is created with a single batched tmux command."""
+    monkeypatch.delenv("TMUX", raising=False)
+    contexts = [
+        {"name": "one", "path": "/tmp/one", "type": "session"},
+        {"name": "two", "path": "/tmp/two", "type": "session"},
+    ]
+
+    operations.open_control_center(contexts)
+
+    mock_run_cmd.assert_called_once_with(
+        [
+            "tmux",
+            "new-session",
+            "-d",
+            "-s",
+            "control-center",
+            "-n",
+            "one",
+            "-c",
+            "/tmp/one",
+            ";",
+            "new-window",
+            "-t",
+            "control-center",
+            "-n",
+            "two",
+            "-c",
+            "/tmp/two",
+            ";",
+            "select-window",
+            "-t",
+            "control-center:^",
+        ],
+        check=True,
+    )
+    mock_open_tmux.assert_called_once_with("control-center")
+
+
+@patch("par.operations.run_cmd")
+def test_run_tmux_batch_escapes_trailing_semicolons(mock_run_cmd):
+    """Arguments ending in ';' are escaped so tmux does not split the batch on them."""
+    operations.run_tmux_batch(
+        [
+            ["new-session", "-d", "-s", "cc", "-n", "fix;", "-c", "/tmp/wt;"],
+            ["new-window", "-t", "cc", "-n", "semi;colon"],
+        ]
+    )
+
+    mock_run_cmd.assert_called_once_with(
+        [
+            "tmux",
+            "new-session",
+            "-d",
+            "-s",
+            "cc",
+            "-n",
+            "fix\\;",
+            "-c",
+            "/tmp/wt\\;",
+            ";",
+            "new-window",
+            "-t",
+            "cc",
+            "-n",
+            "semi;colon",
+        ],
+        check=True,
+    )
+
+
+@patch("par.operations.shutil.which", return_value="/usr/bin/tmux")
+def test_check_tmux_only_looks_up_tmux_once(mock_which, monkeypatch):
+    """tmux availability is checked once per process."""
+    monkeypatch.setattr(operations, "_tmux_checked", False)
+
+    operations._check_tmux()
+    operations._check_tmux()
+
+    mock_which.assert_called_once_with("tmux")
+
+
+@patch("par.operations.shutil.which", return_value=None)
+def test_check_tmux_exits_when_missing(_mock_which, monkeypatch, capsys):
+    """A missing tmux binary aborts with an error."""
+    monkeypatch.setattr(operations, "_tmux_checked", False)
+
+    with pytest.raises(typer.Exit):
+        operations._check_tmux()
+
+    assert "not found on PATH" in capsys.readouterr().err
+
+
+@patch("par.operations.run_cmd")
+def test_checkout_worktree_fetches_only_the_target_branch(mock_run_cmd):
+    """Checking out a remote branch fetches that branch, without tags."""
+    strategy = CheckoutStrategy(
+        ref="upstream/feature/x", remote="upstream", fetch_remote=True
+    )
+
+    operations.checkout_worktree(
+        "feature/x", Path("/tmp/wt"), strategy, repo_root=Path("/tmp/repo")
+    )
+
+    fetch_call, add_call = mock_run_cmd.call_args_list
+    assert fetch_call.args[0] == ["git", "fetch", "--no-tags", "upstream", "feature/x"]
+    assert add_call.args[0][-2:] == ["/tmp/wt", "upstream/feature/x"]
+
+
+@patch("par.operations.run_cmd")
+def test_checkout_worktree_fetches_pr_head(mock_run_cmd):
+    """PR checkouts fetch the PR head ref and build the worktree from it."""
+    strategy = CheckoutStrategy(
+        ref="origin/pull/42/head", fetch_remote=True, is_pr=True
+    )
+
+    operations.checkout_worktree(
+        "pr-42", Path("/tmp/wt"), strategy, repo_root=Path("/tmp/repo")
+    )
+
+    fetch_call, add_call = mock_run_cmd.call_args_list
+    assert fetch_call.args[0] == ["git", "fetch", "--no-tags", "origin", "pull/42/head"]
+    assert add_call.args[0][-2:] == ["/tmp/wt", "FETCH_HEAD"]
+
+
+@patch("par.operations._check_tmux")
+@patch("par.operations.run_cmd")
+def test_tmux_session_exists_lists_sessions_once(
+    mock_run_cmd, _mock_check_tmux, monkeypatch
+):
+    """Existence checks share one session listing until a session is created."""
+    monkeypatch.setattr(operations, "_session_set_cache", None)
+    mock_run_cmd.return_value = _completed("one\ntwo\n")
+
+    assert operations.tmux_session_exists("one") is True
+    assert operations.tmux_session_exists("three") is False
+    assert mock_run_cmd.call_count == 1
+
+    operations.create_tmux_session("three", Path("/tmp"))
+    mock_run_cmd.return_value = _completed("one\ntwo\nthree\n")
+
+    assert operations.tmux_session_exists("three") is True
@@ -2,8 +2,11 @@
 
 import subprocess
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
 
+import pytest
+import typer
 from typer.testing import CliRunner
 
 from . import cli, core, operations
@@ -45,40 +48,65 @@ def test_cli_create_alias_forwards_base_branch(mock_start_session):
     )
 
 
-@patch("par.core._add_session")
-@patch("par.core.initialization.load_par_config", return_value=None)
-@patch("par.core.operations.create_tmux_session")
-@patch("par.core.operations.create_worktree")
-@patch("par.core.operations.fetch_remote_branch", return_value=False)
-@patch("par.core.operations.branch_exists", return_value=False)
-@patch("par.core.operations.tmux_session_exists", return_value=False)
-@patch("par.core.utils.get_tmux_session_name", return_value="par-repo-1234-feature")
-@patch("par.core.utils.get_worktree_path", return_value=Path("/tmp/worktree"))
-@patch("par.core.utils.resolve_repository_path", return_value=Path("/tmp/repo"))
-@patch("par.core._validate_label_unique", return_value=True)
-def test_start_session_passes_base_branch(
-    _mock_label_unique,
-    _mock_resolve_repo,
-    _mock_get_worktree_path,
-    _mock_get_tmux_name,
-    _mock_tmux_exists,
-    _mock_branch_exists,
-    _mock_fetch_remote,
-    mock_create_worktree,
-    _mock_create_tmux,
-    _mock_load_config,
-    _mock_add_session,
-):
+@pytest.fixture
+def start_mocks(monkeypatch):
+    """Stub out start_session's collaborators for a new, conflict-free session."""
+    mocks = SimpleNamespace(
+        create_worktree=Mock(),
+        create_tmux_session=Mock(),
+        branch_exists=Mock(return_value=False),
+        fetch_remote_branch=Mock(return_value=False),
+    )
+    monkeypatch.setattr(core, "_validate_label_unique", Mock(return_value=True))
+    monkeypatch.setattr(core, "_add_session", Mock())
+    monkeypatch.setattr(
+        core.utils, "resolve_repository_path", Mock(return_value=Path("/tmp/repo"))
+    )
+    monkeypatch.setattr(
+        core.utils, "get_worktree_path", Mock(return_value=Path("/tmp/worktree"))
+    )
+    monkeypatch.setattr(
+        core.utils, "get_tmux_session_name", Mock(return_value="par-repo-1234-feature")
+    )
+    monkeypatch.setattr(core.operations, "tmux_session_exists", Mock(return_value=False))
+    monkeypatch.setattr(core.initialization, "load_par_config", Mock(return_value=None))
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(core.operations, name, mock)
+    return mocks
+
+
+def test_start_session_passes_base_branch(start_mocks):
     """Core start session forwards base branch to worktree creation."""
+    manager = Mock()
+    manager.attach_mock(start_mocks.create_worktree, "create_worktree")
+    manager.attach_mock(start_mocks.create_tmux_session, "create_tmux_session")
+
     core.start_session("feature-auth", base_branch="develop")
 
-    mock_create_worktree.assert_called_once_with(
-        "feature-auth",
-        Path("/tmp/worktree"),
-        Path("/tmp/repo"),
-        base_branch="develop",
-        create_branch=True,
-    )
+    # The tmux session starts in the worktree, so it must be created second
+    manager.assert_has_calls([
+        call.create_worktree(
+            "feature-auth",
+            Path("/tmp/worktree"),
+            Path("/tmp/repo"),
+            base_branch="develop",
+            create_branch=True,
+        ),
+        call.create_tmux_session("par-repo-1234-feature", Path("/tmp/worktree")),
+    ])
+    assert len(manager.mock_calls) == 2
+
+
+def test_start_session_worktree_conflict(start_mocks, monkeypatch, tmp_path):
+    """An existing worktree path aborts start before any git or tmux work."""
+    # tmp_path already exists, so it stands in for a leftover worktree directory
+    monkeypatch.setattr(core.utils, "get_worktree_path", Mock(return_value=tmp_path))
+
+    with pytest.raises(typer.Exit):
+        core.start_session("feature-auth")
+
+    start_mocks.create_worktree.assert_not_called()
+    start_mocks.create_tmux_session.assert_not_called()
 
 
 @patch("par.operations.run_cmd")
@@ -108,6 +136,8 @@ def test_create_worktree_uses_resolved_base_commit(mock_run_cmd):
     second_call = mock_run_cmd.call_args_list[1]
     assert second_call.args[0] == [
         "git",
+        "-c",
+        "checkout.workers=0",
         "worktree",
         "add",
         "-b",
@@ -132,7 +162,8 @@ def test_create_worktree_without_base_branch(mock_run_cmd):
     )
 
     mock_run_cmd.assert_called_once_with(
-        ["git", "worktree", "add", "-b", "feature-auth", "/tmp/worktree"],
+        ["git", "-c", "checkout.workers=0", "worktree", "add", "-b", "feature-auth",
+         "/tmp/worktree"],
         cwd=Path("/tmp/repo"),
     )
 
@@ -152,7 +183,8 @@ def test_create_worktree_existing_branch(mock_run_cmd):
     )
 
     mock_run_cmd.assert_called_once_with(
-        ["git", "worktree", "add", "/tmp/worktree", "feature-auth"],
+        ["git", "-c", "checkout.workers=0", "worktree", "add", "/tmp/worktree",
+         "feature-auth"],
         cwd=Path("/tmp/repo"),
     )
 
@@ -182,6 +214,8 @@ def test_create_worktree_retries_when_branch_already_exists(mock_run_cmd):
     second_call = mock_run_cmd.call_args_list[1]
     assert second_call.args[0] == [
         "git",
+        "-c",
+        "checkout.workers=0",
         "worktree",
         "add",
         "/tmp/worktree",
@@ -189,34 +223,13 @@ def test_create_worktree_retries_when_branch_already_exists(mock_run_cmd):
     ]
 
 
-@patch("par.core._add_session")
-@patch("par.core.initialization.load_par_config", return_value=None)
-@patch("par.core.operations.create_tmux_session")
-@patch("par.core.operations.create_worktree")
-@patch("par.core.operations.fetch_remote_branch", return_value=False)
-@patch("par.core.operations.branch_exists", return_value=True)
-@patch("par.core.operations.tmux_session_exists", return_value=False)
-@patch("par.core.utils.get_tmux_session_name", return_value="par-repo-1234-feature")
-@patch("par.core.utils.get_worktree_path", return_value=Path("/tmp/worktree"))
-@patch("par.core.utils.resolve_repository_path", return_value=Path("/tmp/repo"))
-@patch("par.core._validate_label_unique", return_value=True)
-def test_start_session_existing_branch_uses_checkout_mode(
-    _mock_label_unique,
-    _mock_resolve_repo,
-    _mock_get_worktree_path,
-    _mock_get_tmux_name,
-    _mock_tmux_exists,
-    _mock_branch_exists,
-    _mock_fetch_remote,
-    mock_create_worktree,
-    _mock_create_tmux,
-    _mock_load_config,
-    _mock_add_session,
-):
+def test_start_session_existing_branch_uses_checkout_mode(start_mocks):
     """If label already exists as branch, start checks out that branch in new worktree."""
+    start_mocks.branch_exists.return_value = True
+
     core.start_session("feature-auth", base_branch="develop")
 
-    mock_create_worktree.assert_called_once_with(
+    start_mocks.create_worktree.assert_called_once_with(
         "feature-auth",
         Path("/tmp/worktree"),
         Path("/tmp/repo"),
@@ -225,34 +238,13 @@ def test_start_session_existing_branch_uses_checkout_mode(
     )
 
 
-@patch("par.core._add_session")
-@patch("par.core.initialization.load_par_config", return_value=None)
-@patch("par.core.operations.create_tmux_session")
-@patch("par.core.operations.create_worktree")
-@patch("par.core.operations.fetch_remote_branch", return_value=True)
-@patch("par.core.operations.branch_exists", return_value=False)
-@patch("par.core.operations.tmux_session_exists", return_value=False)
-@patch("par.core.utils.get_tmux_session_name", return_value="par-repo-1234-feature")
-@patch("par.core.utils.get_worktree_path", return_value=Path("/tmp/worktree"))
-@patch("par.core.utils.resolve_repository_path", return_value=Path("/tmp/repo"))
-@patch("par.core._validate_label_unique", return_value=True)
-def test_start_session_existing_remote_branch_fetches_and_checks_out(
-    _mock_label_unique,
-    _mock_resolve_repo,
-    _mock_get_worktree_path,
-    _mock_get_tmux_name,
-    _mock_tmux_exists,
-    _mock_branch_exists,
-    _mock_fetch_remote,
-    mock_create_worktree,
-    _mock_create_tmux,
-    _mock_load_config,
-    _mock_add_session,
-):
+def test_start_session_existing_remote_branch_fetches_and_checks_out(start_mocks):
     """If label exists on origin, start branches from origin/<label>."""
+    start_mocks.fetch_remote_branch.return_value = True
+
     core.start_session("feature-auth")
 
-    mock_create_worktree.assert_called_once_with(
+    start_mocks.create_worktree.assert_called_once_with(
         "feature-auth",
         Path("/tmp/worktree"),
         Path("/tmp/repo"),
@@ -270,7 +262,7 @@ def test_fetch_remote_branch_success(mock_run_cmd):
 
     assert operations.fetch_remote_branch("feature-auth", Path("/tmp/repo")) is True
     mock_run_cmd.assert_called_once_with(
-        ["git", "fetch", "origin", "feature-auth"],
+        ["git", "fetch", "--no-tags", "origin", "feature-auth"],
         cwd=Path("/tmp/repo"),
         suppress_output=True,
     )
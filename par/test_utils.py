@@ -0,0 +1,75 @@
+"""Tests for par utility helpers."""
+
+import hashlib
+from unittest.mock import patch
+
+from . import utils
+
+
+def test_repo_id_matches_resolved_path_hash(tmp_path):
+    """Repository IDs hash the resolved path and are stable across calls."""
+    expected = hashlib.sha256(str(tmp_path.resolve()).encode()).hexdigest()
+
+    assert utils._get_repo_id(tmp_path) == expected[:8]
+    assert utils.get_repo_id(tmp_path) == expected[:12]
+    assert utils._get_repo_id(tmp_path) == expected[:8]
+
+
+def test_is_managed_path(tmp_path, monkeypatch):
+    """Only paths strictly inside the data directory count as managed."""
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    data_dir = utils.get_data_dir()
+
+    assert utils.is_managed_path(data_dir / "worktrees" / "abc" / "label")
+    assert not utils.is_managed_path(data_dir)
+    assert not utils.is_managed_path(tmp_path / "par-other" / "label")
+    assert not utils.is_managed_path(tmp_path / "elsewhere")
+
+
+def test_get_git_repo_root_walks_up_without_git(tmp_path, monkeypatch):
+    """The repository root is found from a subdirectory without running git."""
+    repo_root = tmp_path / "repo"
+    nested = repo_root / "src" / "pkg"
+    nested.mkdir(parents=True)
+    (repo_root / ".git").mkdir()
+    monkeypatch.chdir(nested)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+
+    with patch("par.utils.run_cmd") as mock_run_cmd:
+        assert utils.get_git_repo_root() == repo_root.resolve()
+
+    mock_run_cmd.assert_not_called()
+
+
+def test_get_git_repo_root_accepts_git_file(tmp_path, monkeypatch):
+    """Worktrees use a .git file, which also marks the top level."""
+    (tmp_path / ".git").write_text("gitdir: /elsewhere\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+
+    assert utils.get_git_repo_root() == tmp_path.resolve()
+
+
+def test_get_git_repo_root_is_cached_per_directory(tmp_path, monkeypatch):
+    """Repeated lookups from the same directory only run discovery once."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_DIR", str(tmp_path / ".git"))
+
+    with patch("par.utils.run_cmd") as mock_run_cmd:
+        mock_run_cmd.return_value.stdout = f"{tmp_path}\n"
+        assert utils.get_git_repo_root() == tmp_path
+        assert utils.get_git_repo_root() == tmp_path
+
+    mock_run_cmd.assert_called_once()
+
+
+def test_detect_git_repos(tmp_path):
+    """Only immediate subdirectories containing .git are reported, sorted."""
+    for name in ("web", "api"):
+        (tmp_path / name / ".git").mkdir(parents=True)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "notes.txt").write_text("")
+
+    assert utils.detect_git_repos(tmp_path) == [tmp_path / "api", tmp_path / "web"]
@@ -0,0 +1,67 @@
+"""Tests for par workspace management."""
+
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from . import workspace
+
+
+@pytest.fixture
+def workspace_root(tmp_path, monkeypatch):
+    """A directory holding two git repositories, with par data kept under tmp_path."""
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    root = tmp_path / "ws"
+    for name in ("api", "web"):
+        (root / name / ".git").mkdir(parents=True)
+    return root
+
+
+@patch("par.workspace.operations.create_workspace_worktree", autospec=True)
+@patch(
+    "par.workspace.operations.tmux_session_exists", return_value=False, autospec=True
+)
+def test_start_workspace_rejects_duplicate_repos(
+    _mock_session_exists, mock_create_worktree, workspace_root
+):
+    """Listing a repository twice fails before any worktree is created."""
+    with pytest.raises(typer.Exit):
+        workspace.start_workspace_session(
+            "feat", str(workspace_root), repos=["api", "api"]
+        )
+
+    mock_create_worktree.assert_not_called()
+
+
+@patch("par.workspace._add_workspace_session", autospec=True)
+@patch("par.workspace.operations.delete_branch", autospec=True)
+@patch("par.workspace.operations.remove_workspace_worktree", autospec=True)
+@patch("par.workspace.operations.create_workspace_worktree", autospec=True)
+@patch(
+    "par.workspace.operations.tmux_session_exists", return_value=False, autospec=True
+)
+def test_start_workspace_rolls_back_when_a_repo_fails(
+    _mock_session_exists,
+    mock_create_worktree,
+    mock_remove_worktree,
+    mock_delete_branch,
+    mock_add_session,
+    workspace_root,
+):
+    """If one repo's worktree fails, worktrees created in the others are removed."""
+
+    def _create(repo_path, label, worktree_path, base_branch=None):
+        if repo_path.name == "web":
+            raise typer.Exit(1)
+
+    mock_create_worktree.side_effect = _create
+
+    with pytest.raises(typer.Exit):
+        workspace.start_workspace_session("feat", str(workspace_root))
+
+    api = workspace_root / "api"
+    mock_remove_worktree.assert_called_once()
+    assert mock_remove_worktree.call_args.args[0] == api
+    mock_delete_branch.assert_called_once_with("feat", api)
+    mock_add_session.assert_not_called()
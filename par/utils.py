@@ -1,5 +1,6 @@
 """Simplified utilities for par"""
 
+import functools
 import hashlib
 import os
 import subprocess
@@ -24,7 +25,6 @@ def run_cmd(
             capture_output=capture,
             text=True,
             check=check,
-            env=os.environ.copy(),
         )
         return result
     except subprocess.CalledProcessError as e:
@@ -38,11 +38,42 @@ def run_cmd(
         raise typer.Exit(127)
 
 
+def _find_git_toplevel(start: Path) -> Optional[Path]:
+    """Walk up from start to the nearest directory containing a .git entry."""
+    for directory in (start, *start.parents):
+        # .git is a directory in a regular checkout and a file in worktrees/submodules
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
 def get_git_repo_root() -> Path:
     """Get the root directory of the current git repository."""
+    # Discovery depends only on the working directory and git's environment
+    # overrides, so resolve each combination once per process.
+    return _cached_git_repo_root(
+        os.getcwd(), os.getenv("GIT_DIR"), os.getenv("GIT_WORK_TREE")
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_git_repo_root(
+    cwd: str, git_dir: Optional[str], git_work_tree: Optional[str]
+) -> Path:
+    # Find the repository with a few stats instead of spawning git. Environment
+    # overrides change how git discovers repositories, so defer to git then.
+    if not (git_dir or git_work_tree):
+        try:
+            repo_root = _find_git_toplevel(Path(cwd))
+        except OSError:
+            repo_root = None
+        if repo_root is not None:
+            return repo_root
+
     try:
         result = run_cmd(
             ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
             capture=True,
             suppress_output=True,
         )
@@ -67,9 +98,31 @@ def get_data_dir() -> Path:
     return data_dir
 
 
+def is_managed_path(path: Path) -> bool:
+    """Check whether a path lives inside par's data directory."""
+    # A single string prefix test instead of walking and comparing path.parents
+    return str(path).startswith(str(get_data_dir()) + os.sep)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_path_digest(path: Path) -> str:
+    return hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+
+
+def _path_digest(path: Path) -> str:
+    """Hash a path's resolved location.
+
+    Absolute paths are memoized so repeated lookups for the same repository or
+    workspace skip the per-component stat/readlink calls of Path.resolve().
+    """
+    if path.is_absolute():
+        return _cached_path_digest(path)
+    return hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+
+
 def _get_repo_id(repo_root: Path) -> str:
     """Generate a unique ID for the repository."""
-    return hashlib.sha256(str(repo_root.resolve()).encode()).hexdigest()[:8]
+    return _path_digest(repo_root)[:8]
 
 
 def get_worktree_path(repo_root: Path, label: str) -> Path:
@@ -89,7 +142,7 @@ def get_tmux_session_name(repo_root: Path, label: str) -> str:
 
 def get_repo_id(repo_root: Path) -> str:  # New function
     """Generates a unique, filesystem-friendly ID for the repository."""
-    return hashlib.sha256(str(repo_root.resolve()).encode()).hexdigest()[:12]
+    return _path_digest(repo_root)[:12]
 
 
 def get_worktrees_base_dir() -> Path:  # New function (ensure it exists)
@@ -126,9 +179,12 @@ def detect_git_repos(directory: Path) -> List[Path]:
     if not directory.is_dir():
         return repos
 
-    for subdir in directory.iterdir():
-        if subdir.is_dir() and (subdir / ".git").exists():
-            repos.append(subdir)
+    # scandir reports entry types from the directory listing itself, so only
+    # the .git probe needs a stat per subdirectory
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git")):
+                repos.append(Path(entry.path))
 
     return sorted(repos)
 
@@ -137,9 +193,7 @@ def get_workspace_worktree_path(
     workspace_root: Path, workspace_label: str, repo_name: str, label: str
 ) -> Path:
     """Get the path for a workspace worktree."""
-    workspace_id = hashlib.sha256(str(workspace_root.resolve()).encode()).hexdigest()[
-        :8
-    ]
+    workspace_id = _path_digest(workspace_root)[:8]
     workspace_dir = get_data_dir() / "workspaces" / workspace_id / workspace_label
     workspace_dir.mkdir(parents=True, exist_ok=True)
     return workspace_dir / repo_name / label
@@ -150,9 +204,7 @@ def get_workspace_session_name(workspace_root: Path, workspace_label: str) -> st
     workspace_name = (
         workspace_root.name.lower().replace(" ", "-").replace(".", "-")[:15]
     )
-    workspace_id = hashlib.sha256(str(workspace_root.resolve()).encode()).hexdigest()[
-        :4
-    ]
+    workspace_id = _path_digest(workspace_root)[:4]
     return f"par-ws-{workspace_name}-{workspace_id}-{workspace_label}"
 
 
@@ -181,9 +233,7 @@ def generate_vscode_workspace(workspace_label: str, repos_data: List[Dict]) -> D
 
 def get_workspace_file_path(workspace_root: Path, workspace_label: str) -> Path:
     """Get the path for a workspace file."""
-    workspace_id = hashlib.sha256(str(workspace_root.resolve()).encode()).hexdigest()[
-        :8
-    ]
+    workspace_id = _path_digest(workspace_root)[:8]
     workspace_dir = get_data_dir() / "workspaces" / workspace_id / workspace_label
     workspace_dir.mkdir(parents=True, exist_ok=True)
     return workspace_dir / f"{workspace_label}.code-workspace"
@@ -1,12 +1,11 @@
 """Workspace management for multi-repository development."""
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from . import core, initialization, operations, utils
 
@@ -93,23 +92,47 @@ def start_workspace_session(
         typer.secho(f"Error: tmux session '{session_name}' exists.", fg="red", err=True)
         raise typer.Exit(1)
 
-    # Create worktrees for each repo
-    repos_data = []
-    for repo_path, repo_name in zip(repo_paths, repo_names):
+    # Check every worktree path before creating anything
+    worktree_paths = []
+    for repo_name in repo_names:
         worktree_path = utils.get_workspace_worktree_path(
             workspace_root, label, repo_name, label
         )
-
-        # Check for conflicts
+        if worktree_path in worktree_paths:
+            typer.secho(
+                f"Error: Repository '{repo_name}' is listed more than once.",
+                fg="red",
+                err=True,
+            )
+            raise typer.Exit(1)
         if worktree_path.exists():
             typer.secho(
                 f"Error: Worktree path '{worktree_path}' exists.", fg="red", err=True
             )
             raise typer.Exit(1)
+        worktree_paths.append(worktree_path)
+
+    # Create worktrees for each repo. Repos are independent, so run git in
+    # all of them concurrently.
+    with ThreadPoolExecutor(max_workers=min(16, len(repo_paths))) as executor:
+        futures = [
+            executor.submit(
+                operations.create_workspace_worktree, repo_path, label, worktree_path
+            )
+            for repo_path, worktree_path in zip(repo_paths, worktree_paths)
+        ]
+    failures = [future.exception() for future in futures if future.exception()]
+    if failures:
+        # The workspace is never recorded, so undo the repos that did succeed;
+        # otherwise their worktrees and branches could not be removed with par
+        for future, repo_path, worktree_path in zip(futures, repo_paths, worktree_paths):
+            if future.exception() is None:
+                operations.remove_workspace_worktree(repo_path, worktree_path)
+                operations.delete_branch(label, repo_path)
+        raise failures[0]
 
-        # Create resources
-        operations.create_workspace_worktree(repo_path, label, worktree_path)
-
+    repos_data = []
+    for repo_path, repo_name, worktree_path in zip(repo_paths, repo_names, worktree_paths):
         # Copy includes for this repository
         config = initialization.load_par_config(repo_path)
         if config:
@@ -175,14 +198,16 @@ def start_workspace_session(
 
 def list_workspace_sessions():
     """List all workspace sessions globally (now shown in main par ls)."""
-    all_sessions = core._get_all_sessions()
-    workspace_sessions = {k: v for k, v in all_sessions.items() if v.get("session_type") == "workspace"}
+    workspace_sessions = core._get_workspace_sessions()
 
     if not workspace_sessions:
         typer.secho("No workspace sessions found.", fg="yellow")
         typer.echo("Workspaces are now shown in 'par ls' alongside regular sessions.")
         return
 
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
     table = Table(show_header=True, header_style="bold magenta", title="Workspace Sessions")
     table.add_column("Label", style="cyan", no_wrap=True)
@@ -223,9 +248,7 @@ def remove_workspace_session(label: str):
 
 def remove_all_workspace_sessions():
     """Remove all workspace sessions globally."""
-    # Get all workspace sessions from global sessions
-    all_sessions = core._get_all_sessions()
-    workspace_sessions = {k: v for k, v in all_sessions.items() if v.get("session_type") == "workspace"}
+    workspace_sessions = core._get_workspace_sessions()
 
     if not workspace_sessions:
         typer.secho("No workspace sessions to remove.", fg="yellow")